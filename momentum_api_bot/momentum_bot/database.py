@@ -1,12 +1,16 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, insert, Column, Integer, String, Float, DateTime, Index
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import declarative_base, sessionmaker
 import datetime
 
 Base = declarative_base()
 
 class Trade(Base):
     __tablename__ = 'trades'
+    __table_args__ = (
+        Index('ix_trades_symbol_status', 'symbol', 'status'),
+        Index('ix_trades_entry_ts', 'entry_timestamp'),
+    )
 
     id = Column(Integer, primary_key=True)
     symbol = Column(String, nullable=False)
@@ -30,13 +34,54 @@ class PositionRecord(Base):
     quantity = Column(Integer, nullable=False)
     avg_entry_price = Column(Float, nullable=False)
     entry_timestamp = Column(DateTime, default=datetime.datetime.now)
-    status = Column(String, default='OPEN') # OPEN, CLOSED
+    status = Column(String, default='OPEN', index=True) # OPEN, CLOSED
 
     def __repr__(self):
         return f"<PositionRecord(id={self.id}, symbol='{self.symbol}', quantity={self.quantity}, status='{self.status}')>"
 
+# Engines are shared per URL so repeated init_db calls reuse one connection pool
+_engines = {}
+
 def init_db(database_url: str):
-    engine = create_engine(database_url)
-    Base.metadata.create_all(engine)
+    engine = _engines.get(database_url)
+    if engine is None:
+        engine = create_engine(database_url, pool_pre_ping=True, insertmanyvalues_page_size=1000)
+        Base.metadata.create_all(engine)
+        # create_all skips tables that already exist, so add any indexes that
+        # were introduced after an existing database was first created.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+        _engines[database_url] = engine
     Session = sessionmaker(bind=engine)
     return Session
+
+def bulk_insert_trades(session, rows: list[dict], chunk_size: int = 1000):
+    """
+    Inserts many trades with Core multi-row INSERTs instead of adding ORM
+    objects one at a time. Rows are dicts of Trade column values and should
+    share the same keys. The caller owns the transaction and must commit.
+    """
+    for start in range(0, len(rows), chunk_size):
+        session.execute(insert(Trade), rows[start:start + chunk_size])
+
+def bulk_upsert_positions(session, rows: list[dict]):
+    """
+    Inserts positions, updating the existing row when the symbol is already
+    present, in a single statement rather than a SELECT-then-UPDATE per row.
+    The caller owns the transaction and must commit.
+    """
+    if not rows:
+        return
+
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        stmt = postgresql.insert(PositionRecord)
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(PositionRecord)
+    else:
+        raise NotImplementedError(f"Position upsert is not supported for the '{dialect}' dialect.")
+
+    update_columns = {key: stmt.excluded[key] for key in rows[0] if key not in ('id', 'symbol')}
+    stmt = stmt.on_conflict_do_update(index_elements=['symbol'], set_=update_columns)
+    session.execute(stmt, rows)
@@ -0,0 +1,97 @@
+"""
+Contains the BarBuffer class, used by the IBKRBridge to collect the bars of a
+reqHistoricalData request while it is in flight.
+
+Bars are written column by column into NumPy arrays rather than kept as one
+dict per bar, so a long fetch costs a handful of contiguous allocations and
+the finished result can be handed to pandas without a Python loop.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Regular-trading-hours seconds covered by each unit, since bars are requested
+# with useRTH=1 (a 6.5 hour session, 5 sessions a week, ~21 a month).
+_RTH_SESSION_SECONDS = 6.5 * 60 * 60
+_DURATION_UNIT_SECONDS = {
+    'S': 1,
+    'D': _RTH_SESSION_SECONDS,
+    'W': 5 * _RTH_SESSION_SECONDS,
+    'M': 21 * _RTH_SESSION_SECONDS,
+    'Y': 252 * _RTH_SESSION_SECONDS,
+}
+_BAR_UNIT_SECONDS = {
+    'sec': 1,
+    'min': 60,
+    'hour': 60 * 60,
+    'day': _RTH_SESSION_SECONDS,
+    'week': 5 * _RTH_SESSION_SECONDS,
+    'month': 21 * _RTH_SESSION_SECONDS,
+}
+
+def expected_bar_count(duration: str, bar_size: str, default: int = 1024) -> int:
+    """
+    Estimates how many bars a request such as ('2 D', '1 min') returns, so the
+    buffer can be sized once. Falls back to `default` for strings it can't read.
+    """
+    try:
+        duration_value, duration_unit = duration.split()
+        bar_value, bar_unit = bar_size.split()
+        total_seconds = int(duration_value) * _DURATION_UNIT_SECONDS[duration_unit.upper()]
+        bar_seconds = int(bar_value) * _BAR_UNIT_SECONDS[bar_unit.lower().rstrip('s')]
+    except (ValueError, KeyError):
+        return default
+    # IBKR refuses requests far beyond this; don't preallocate for them.
+    return min(int(total_seconds // bar_seconds) + 1, 1 << 20)
+
+def _parse_bar_date(value: str):
+    """
+    Converts a bar date requested with formatDate=2 into something a
+    datetime64[s] slot accepts: intraday bars arrive as epoch seconds, daily
+    and coarser bars as 'YYYYMMDD'.
+    """
+    if len(value) == 8:
+        return np.datetime64(f"{value[:4]}-{value[4:6]}-{value[6:]}", 's')
+    return int(value)
+
+class BarBuffer:
+    """
+    A growable column store for OHLCV bars. Columns start at `capacity` rows
+    and double whenever they fill up.
+    """
+
+    COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._time = np.empty(capacity, dtype='datetime64[s]')
+        self._columns = {name: np.empty(capacity, dtype=np.float64) for name in self.COLUMNS}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, bar: dict):
+        """Writes one bar, as packaged by IBWrapper.historicalData, into the next row."""
+        i = self._size
+        if i == len(self._time):
+            self._grow()
+
+        self._time[i] = _parse_bar_date(bar['date'])
+        columns = self._columns
+        columns['open'][i] = bar['open']
+        columns['high'][i] = bar['high']
+        columns['low'][i] = bar['low']
+        columns['close'][i] = bar['close']
+        columns['volume'][i] = bar['volume']
+        self._size = i + 1
+
+    def to_frame(self) -> pd.DataFrame:
+        """Returns the collected bars as a DataFrame indexed by bar time (UTC for intraday bars)."""
+        n = self._size
+        index = pd.DatetimeIndex(self._time[:n], name='date')
+        return pd.DataFrame({name: column[:n] for name, column in self._columns.items()}, index=index)
+
+    def _grow(self):
+        capacity = max(1, len(self._time) * 2)
+        self._time = np.resize(self._time, capacity)
+        self._columns = {name: np.resize(column, capacity) for name, column in self._columns.items()}
@@ -5,7 +5,7 @@ with the Interactive Brokers API.
 This class is responsible for:
 1.  Managing the dedicated thread for the synchronous official 'ibapi'.
 2.  Instantiating and connecting the IBClient and IBWrapper.
-3.  Managing the thread-safe queue for receiving messages.
+3.  Managing the asyncio queue the API thread feeds incoming messages into.
 4.  Providing a high-level, asynchronous interface for the rest of the application.
 5.  Managing the request/response lifecycle using unique IDs and asyncio.Future objects.
 6.  Handling the connection state machine (Disconnected, Connecting, Operational).
@@ -13,25 +13,32 @@ This class is responsible for:
 """
 
 import asyncio
-import queue
+import itertools
+import socket
 import threading
+import time
 import logging
-from dataclasses import dataclass, field
+import pandas as pd
+from dataclasses import dataclass
 from typing import Optional, Callable, Coroutine, Any, List
 
 from ibapi.client import EClient
 from .wrapper import IBWrapper
+from .rate_limiter import SlidingWindowLimiter
+from .bar_buffer import BarBuffer, expected_bar_count
 from ibapi.contract import Contract
 from ibapi.order import Order
 
+logger = logging.getLogger(__name__)
+
 # --- Data model for the request registry ---
-@dataclass
+@dataclass(slots=True)
 class RequestContext:
     """Holds the context for a single pending request."""
     reqId: int
     future: asyncio.Future
     request_type: str  # The type of the original request, e.g., 'REQ_NEWS_PROVIDERS'
-    data_aggregator: List = field(default_factory=list) # For multi-part responses
+    data_aggregator: Any = None # For multi-part responses, a BarBuffer for historical data
 
 class IBKRBridge:
     """
@@ -39,8 +46,24 @@ class IBKRBridge:
     synchronous, threaded IBKR API client.
     """
     
-    # Fixed request ids for infrequently api calls
-    REQ_ID_NEWS_PROVIDERS = -101
+    # Fixed request ids for infrequently api calls, shared with the wrapper
+    # which stamps them onto reqId-less callbacks.
+    REQ_ID_NEWS_PROVIDERS = IBWrapper.REQ_ID_NEWS_PROVIDERS
+
+    # The permissioned provider list rarely changes, so reuse it for a day
+    NEWS_PROVIDERS_TTL = 24 * 60 * 60
+
+    # Message types that answer a pending request rather than a subscription
+    RESPONSE_TYPES = frozenset({
+        'HISTORICAL_DATA_BAR', 'HISTORICAL_DATA_END', 'ERROR', 'ACCOUNT_SUMMARY_END',
+        'NEWS_PROVIDERS', 'CONTRACT_DETAILS', 'CONTRACT_DETAILS_END'
+    })
+
+    # Upper bound on messages handled per dispatcher wakeup
+    DISPATCH_BATCH_SIZE = 64
+
+    # While the raw news queue overflows, log the running drop count this often
+    DROPPED_HEADLINES_LOG_INTERVAL = 1000
 
     def __init__(self, host: str, port: int, client_id: int, raw_news_queue: Optional[asyncio.Queue] = None):
         self.state = "DISCONNECTED"
@@ -49,31 +72,56 @@ class IBKRBridge:
         self.client_id = client_id
         self.raw_news_queue = raw_news_queue
         
-        self.incoming_queue = queue.Queue()
+        self.incoming_queue = asyncio.Queue()
         self.wrapper = IBWrapper(self.incoming_queue)
         self.client = EClient(self.wrapper)
         
         self.api_thread = None
+        self._loop = None  # The event loop the bridge was connected from
         self.dispatcher_task = None
         self.connection_established_event = asyncio.Event()
         self._pending_requests = {}
+        self._response_handlers = {
+            'HISTORICAL_DATA_BAR': self._append_historical_bar,
+            'HISTORICAL_DATA_END': self._finish_historical_data,
+            'CONTRACT_DETAILS': self._append_contract_details,
+            'CONTRACT_DETAILS_END': self._finish_contract_details,
+            'NEWS_PROVIDERS': self._resolve_news_providers,
+            'ERROR': self._reject,
+        }
+        self._inflight_contract_details = {}
+        self._inflight_historical_data = {}
+        self._contract_details_cache = {}
+        self._news_contracts = {}
+        self._news_providers_cache = None  # (fetched_at, providers)
+        self._dropped_headlines = 0  # Since the raw news queue last drained
         
-        self._next_req_id = 0
-        self._req_id_lock = threading.Lock()
+        # count.__next__ is a single C call, so this is safe to advance
+        # from any thread without a lock.
+        self._req_id_counter = itertools.count(1).__next__
         self._next_order_id = -1
         self._order_id_lock = threading.Lock()
+        # Held across reserve-and-send so order ids reach TWS in increasing order
+        self._order_send_lock = asyncio.Lock()
+
+        # Outbound pacing: the general 50 msg/s cap, plus the much tighter
+        # historical data budget (60 requests per 10 minutes).
+        self._msg_limiter = SlidingWindowLimiter(max_calls=50, period=1)
+        self._hist_limiter = SlidingWindowLimiter(max_calls=60, period=600)
 
     # --- Public High-Level Async Methods (The Application Interface) ---
 
     async def connect(self):
         if self.state != "DISCONNECTED":
-            logging.warning("Bridge is already connected or connecting.")
+            logger.warning("Bridge is already connected or connecting.")
             return
 
-        logging.info(f"Connecting to IBKR at {self.host}:{self.port}...")
+        logger.info("Connecting to IBKR at %s:%s...", self.host, self.port)
         self.state = "CONNECTING"
 
         self.connection_established_event.clear()
+        self._loop = asyncio.get_running_loop()
+        self.wrapper.loop = self._loop
 
         self._start_api_thread()
         
@@ -83,9 +131,9 @@ class IBKRBridge:
             # Wait for the event to be set by the dispatcher, with a timeout.
             await asyncio.wait_for(self.connection_established_event.wait(), timeout=10)
             self.state = "OPERATIONAL"
-            logging.info("IBKR Bridge is now OPERATIONAL.")
+            logger.info("IBKR Bridge is now OPERATIONAL.")
         except asyncio.TimeoutError:
-            logging.error("Connection to IBKR timed out. Failed to receive nextValidId.")
+            logger.error("Connection to IBKR timed out. Failed to receive nextValidId.")
             await self.disconnect()
             # self.state is already set to DISCONNECTED by disconnect()
             raise ConnectionError("IBKR connection timed out.")
@@ -94,7 +142,7 @@ class IBKRBridge:
         if self.state == "DISCONNECTED":
             return
             
-        logging.info("Disconnecting from IBKR...")
+        logger.info("Disconnecting from IBKR...")
         self.state = "DISCONNECTED"
 
         if self.dispatcher_task:
@@ -106,16 +154,22 @@ class IBKRBridge:
         if self.api_thread and self.api_thread.is_alive():
             self.api_thread.join(timeout=5)
         
-        logging.info("IBKR Bridge disconnected.")
+        logger.info("IBKR Bridge disconnected.")
 
     async def request_news_providers(self) -> list:
         """
         Requests the list of news providers the account is permissioned for.
+        A successful answer is cached for NEWS_PROVIDERS_TTL seconds.
         """
-        logging.info("Requesting news providers...")
+        if self._news_providers_cache is not None:
+            fetched_at, providers = self._news_providers_cache
+            if time.monotonic() - fetched_at < self.NEWS_PROVIDERS_TTL:
+                return providers
+
+        logger.info("Requesting news providers...")
         
         req_id = self.REQ_ID_NEWS_PROVIDERS # This is -101
-        future = asyncio.get_running_loop().create_future()
+        future = self._create_future()
         
         # Manually register the future with the correct, fixed ID
         self._pending_requests[req_id] = RequestContext(
@@ -124,150 +178,352 @@ class IBKRBridge:
             request_type='NEWS_PROVIDERS'
         )
         
-        # Make the direct API call
-        self.client.reqNewsProviders()
-        
-        # Wait for the future to be resolved by the dispatcher
         try:
-            # Add a timeout for safety
+            # Make the direct API call
+            await self._msg_limiter.acquire()
+            self.client.reqNewsProviders()
+
+            # Wait for the future to be resolved by the dispatcher, with a timeout for safety
             response = await asyncio.wait_for(future, timeout=10)
-            return response.get('data', {}).get('providers', [])
+            providers = response.get('data', {}).get('providers', [])
+            if providers:
+                self._news_providers_cache = (time.monotonic(), providers)
+            return providers
         except asyncio.TimeoutError:
-            logging.error("Request for news providers timed out.")
-            # Clean up the pending request to prevent memory leaks
-            self._pending_requests.pop(req_id, None)
+            logger.error("Request for news providers timed out.")
             return []
+        finally:
+            # Clean up the pending request to prevent memory leaks, unless a
+            # newer request has already replaced it under the same fixed id.
+            context = self._pending_requests.get(req_id)
+            if context is not None and context.future is future:
+                del self._pending_requests[req_id]
+
+    async def request_contract_details(self, contract: Contract) -> list:
+        """
+        Requests the full ContractDetails for a contract.
+
+        The future is resolved by contractDetailsEnd, so the caller resumes as
+        soon as IBKR has answered instead of after a fixed delay. Concurrent
+        lookups of the same contract share a single in-flight request, and
+        resolved details are cached for the lifetime of the bridge.
+
+        An empty list means IBKR found no matching contract. Failures raise
+        instead: RuntimeError for an IBKR error, TimeoutError if no answer
+        arrives within 10 seconds.
+        """
+        key = self._contract_key(contract)
+        cached = self._contract_details_cache.get(key)
+        if cached is not None:
+            return cached
+
+        while (inflight := self._inflight_contract_details.get(key)) is not None:
+            details = await asyncio.wait_for(asyncio.shield(inflight), timeout=10)
+            if details is not None:
+                return details
+            # The caller that owned the request gave up without an answer; take over.
+
+        req_id = self._get_next_req_id()
+        future = self._create_future()
+        self._pending_requests[req_id] = RequestContext(
+            reqId=req_id,
+            future=future,
+            request_type='CONTRACT_DETAILS'
+        )
+        self._inflight_contract_details[key] = future
+
+        try:
+            await self._msg_limiter.acquire()
+            self.client.reqContractDetails(req_id, contract)
+            details = await asyncio.wait_for(asyncio.shield(future), timeout=10)
+        except asyncio.TimeoutError:
+            logger.error("Request for contract details of %s timed out.", contract.symbol)
+            raise
+        finally:
+            self._inflight_contract_details.pop(key, None)
+            if not future.done():
+                # Timed out or cancelled (possibly before the request was even
+                # sent): drop the registry entry and wake any sharers with None
+                # so they re-issue the request rather than inherit this outcome.
+                self._pending_requests.pop(req_id, None)
+                future.set_result(None)
+
+        if details:
+            self._contract_details_cache[key] = details
+        return details
 
     async def subscribe_to_news_feed(self, provider_code: str):
         req_id = self._get_next_req_id()
-        contract = Contract()
-        
-        # For BroadTape news, use the provider:feed format
-        contract.symbol = f"{provider_code}:{provider_code}_ALL"  # "BZ:BZ_ALL"
-        contract.secType = "NEWS"
-        contract.exchange = provider_code  # "BZ" (not empty!)
+        contract = self._get_news_contract(provider_code)
         
         # Use generic tick type 292 for news headlines
+        await self._msg_limiter.acquire()
         self.client.reqMktData(req_id, contract, "292", False, False, [])
-        logging.info(f"Sent subscription request for news provider: {provider_code} with reqId {req_id}")
-
-
-    async def fetch_historical_data(self, contract: Contract, duration: str, bar_size: str) -> list:
-        logging.info(f"Requesting historical data for {contract.symbol}...")
-        future = await self._send_request(
-            'REQ_HISTORICAL_DATA',
-            contract=contract,
-            durationStr=duration,
-            barSizeSetting=bar_size,
-            whatToShow='TRADES',
-            useRTH=1,
-            formatDate=1,
-            keepUpToDate=False
-        )
-        # The EClient method is called inside _send_request for this pattern
-        response = await future
-        return response.get('data', [])
+        logger.info("Sent subscription request for news provider: %s with reqId %s", provider_code, req_id)
+
+
+    async def fetch_historical_data(self, contract: Contract, duration: str, bar_size: str) -> pd.DataFrame:
+        """
+        Requests historical TRADES bars and returns them as a DataFrame with
+        open/high/low/close/volume columns, indexed by bar time.
+
+        Concurrent calls for the same contract, duration and bar size share a
+        single IBKR request; each caller gets its own copy of the frame.
+        """
+        key = (self._contract_key(contract), duration, bar_size)
+        while (inflight := self._inflight_historical_data.get(key)) is not None:
+            bars = await asyncio.shield(inflight)
+            if bars is not None:
+                return bars.copy()
+            # The caller that owned the request gave up before sending it; take over.
+
+        future = self._create_future()
+        self._inflight_historical_data[key] = future
+        req_id = None
+        sent = False
+        try:
+            logger.debug("Requesting historical data for %s...", contract.symbol)
+            await self._hist_limiter.acquire()
+
+            req_id = self._get_next_req_id()
+            self._pending_requests[req_id] = RequestContext(
+                reqId=req_id,
+                future=future,
+                request_type='HISTORICAL_DATA',
+                data_aggregator=BarBuffer(expected_bar_count(duration, bar_size))
+            )
+
+            await self._msg_limiter.acquire()
+            # formatDate=2 returns intraday bar times as epoch seconds, which the
+            # bar buffer stores without any string parsing.
+            self.client.reqHistoricalData(req_id, contract, '', duration, bar_size, 'TRADES', 1, 2, False, [])
+            sent = True
+            return await asyncio.shield(future)
+        finally:
+            self._inflight_historical_data.pop(key, None)
+            if not sent:
+                # Never reached IBKR, so nothing else will resolve the future. Wake any
+                # sharers with None so they re-issue the request rather than inherit
+                # this caller's cancellation.
+                self._pending_requests.pop(req_id, None)
+                future.set_result(None)
 
     async def place_order(self, contract: Contract, order: Order) -> int:
-        order_id = self._get_next_order_id()
-        order.orderId = order_id
-        
-        self.client.placeOrder(order_id, contract, order)
-        logging.info(f"Sent request to place order {order_id} for {contract.symbol}")
+        async with self._order_send_lock:
+            await self._msg_limiter.acquire()
+            order_id = self._get_next_order_id()
+            order.orderId = order_id
+
+            self.client.placeOrder(order_id, contract, order)
+        logger.info("Sent request to place order %s for %s", order_id, contract.symbol)
         return order_id
+
+    async def place_orders(self, items: List[tuple]) -> List[int]:
+        """
+        Places a basket of (contract, order) pairs, reserving one contiguous
+        block of order ids for the whole basket. Returns the ids in input order.
+
+        Each order waits for its own message slot, so a basket larger than the
+        pacing limit is spread over several windows rather than sent at once.
+        """
+        if not items:
+            return []
+
+        async with self._order_send_lock:
+            first_id = self._reserve_order_ids(len(items))
+            order_ids = []
+            for offset, (contract, order) in enumerate(items):
+                await self._msg_limiter.acquire()
+                order_id = first_id + offset
+                order.orderId = order_id
+                self.client.placeOrder(order_id, contract, order)
+                order_ids.append(order_id)
+        logger.info("Sent requests to place orders %s..%s", first_id, first_id + len(items) - 1)
+        return order_ids
     
     # --- Internal Core Logic Methods ---
 
+    def _create_future(self) -> asyncio.Future:
+        # Fall back to the running loop for calls made before connect().
+        loop = self._loop or asyncio.get_running_loop()
+        return loop.create_future()
+
+    @staticmethod
+    def _contract_key(contract: Contract) -> tuple:
+        """
+        Identifies a contract for request sharing and caching. A conId pins the
+        instrument on its own; without one, every field that tells futures and
+        options on the same symbol apart is part of the key.
+        """
+        if contract.conId:
+            return (contract.conId, contract.exchange)
+        return (
+            contract.symbol, contract.secType, contract.lastTradeDateOrContractMonth,
+            contract.strike, contract.right, contract.multiplier, contract.exchange,
+            contract.primaryExchange, contract.currency, contract.localSymbol
+        )
+
+    def _get_news_contract(self, provider_code: str) -> Contract:
+        """
+        Returns the BroadTape contract for a news provider, building it only on
+        the first subscription. Resubscribing (e.g. after a reconnect) reuses it.
+        """
+        contract = self._news_contracts.get(provider_code)
+        if contract is None:
+            contract = Contract()
+            # For BroadTape news, use the provider:feed format
+            contract.symbol = f"{provider_code}:{provider_code}_ALL"  # "BZ:BZ_ALL"
+            contract.secType = "NEWS"
+            contract.exchange = provider_code  # "BZ" (not empty!)
+            self._news_contracts[provider_code] = contract
+        return contract
+
     def _start_api_thread(self):
         """
         Connects the client and starts the dedicated thread for the EClient's
         internal message processing loop.
         """
         self.client.connect(self.host, self.port, self.client_id)
+        self._tune_socket()
         self.api_thread = threading.Thread(target=self.client.run, daemon=True)
         self.api_thread.start()
-        logging.info("IBKR API thread started, running the internal message loop.")
+        logger.info("IBKR API thread started, running the internal message loop.")
+
+    def _tune_socket(self):
+        """
+        Disables Nagle's algorithm on the API socket. Requests are small and
+        latency-sensitive, so letting the kernel coalesce them only adds delay.
+        """
+        if not self.client.isConnected():
+            return
+        try:
+            sock = self.client.conn.socket
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        except (AttributeError, OSError) as e:
+            logger.warning("Could not tune IBKR socket options: %s", e)
 
     async def _dispatch_incoming_messages(self):
-        logging.info("Async message dispatcher started.")
+        logger.info("Async message dispatcher started.")
+        queue = self.incoming_queue
         while self.state != "DISCONNECTED":
             try:
-                message = await asyncio.to_thread(self.incoming_queue.get)
-                logging.debug(f"Dispatcher received message: {message['type']}")
-                
-                msg_type = message.get('type')
-                if msg_type in ['HISTORICAL_DATA_END', 'ERROR', 'ACCOUNT_SUMMARY_END', 'NEWS_PROVIDERS']:
-                    self._handle_response_message(message)
-                elif msg_type == 'NEWS_TICK':
-                    await self._handle_streaming_message(message)
+                message = await queue.get()
+                self._dispatch_message(message)
+
+                # Handle everything that has already arrived before waiting again,
+                # so a burst of bars or ticks costs one wakeup instead of one each.
+                for _ in range(self.DISPATCH_BATCH_SIZE - 1):
+                    try:
+                        message = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    self._dispatch_message(message)
                 else:
-                    self._handle_system_message(message)
+                    # Batch is full; give other tasks a turn before draining the rest.
+                    await asyncio.sleep(0)
 
             except asyncio.CancelledError:
-                logging.info("Message dispatcher stopping.")
+                logger.info("Message dispatcher stopping.")
                 break
-            except Exception:
-                logging.exception("Error in message dispatcher.")
+
+    def _dispatch_message(self, message: dict):
+        try:
+            logger.debug("Dispatcher received message: %s", message['type'])
+
+            msg_type = message.get('type')
+            if msg_type in self.RESPONSE_TYPES:
+                self._handle_response_message(message)
+            elif msg_type == 'NEWS_TICK':
+                self._handle_streaming_message(message)
+            else:
+                self._handle_system_message(message)
+        except Exception:
+            logger.exception("Error in message dispatcher.")
 
     def _handle_response_message(self, message: dict):
         """
         Handles messages that correspond to a pending request, resolving the
         associated asyncio.Future.
         
-        It can find the pending request in two ways:
-        1. By `reqId` for most standard requests.
-        2. By `request_type` for the few API calls that don't include a `reqId`
-           in their response callbacks (e.g., reqNewsProviders).
+        The pending request is found by `reqId`. API calls whose callbacks carry
+        no `reqId` (e.g., reqNewsProviders) are stamped with a fixed id by the
+        wrapper, so every response can be matched this way.
         """
         msg_type = message['type']
         reqId = message.get('data', {}).get('reqId')
+        context = self._pending_requests.get(reqId)
 
-        context = None
-        # Find the request context, trying by reqId first, then by type.
-        if reqId is not None:
-            context = self._pending_requests.get(reqId)
-        else:
-            # For reqId-less responses, find the first pending request with a matching type.
-            for id, ctx in list(self._pending_requests.items()):
-                if ctx.request_type == msg_type:
-                    context = ctx
-                    reqId = id  # Use the internal ID for removal
-                    break
-        
         if not context:
-            logging.debug(f"No pending request found for message: {message}")
+            logger.debug("No pending request found for message: %s", message)
             return
 
-        # --- Handle different message types ---
-
-        if msg_type == 'HISTORICAL_DATA_BAR':
-            context.data_aggregator.append(message['data']['bar'])
-            return  # Don't resolve future yet, wait for HISTORICAL_DATA_END
-
-        elif msg_type == 'HISTORICAL_DATA_END':
-            result = {'reqId': reqId, 'data': context.data_aggregator or []}
-            if not context.future.done():
-                context.future.set_result(result)
-        
-        elif msg_type == 'NEWS_PROVIDERS':
-            if not context.future.done():
-                context.future.set_result(message)
-                logging.info("Successfully receives all news providers")
-
-        elif msg_type == 'ERROR' and not context.future.done():
+        handler = self._response_handlers.get(msg_type, self._resolve_default)
+        if handler(context, message):
+            # Clean up the pending request
+            self._pending_requests.pop(reqId, None)
+
+    # --- Response handlers ---
+    # Each returns True once the request is complete and can leave the registry.
+
+    def _append_historical_bar(self, context: RequestContext, message: dict) -> bool:
+        context.data_aggregator.append(message['data']['bar'])
+        return False  # Don't resolve future yet, wait for HISTORICAL_DATA_END
+
+    def _finish_historical_data(self, context: RequestContext, message: dict) -> bool:
+        if not context.future.done():
+            context.future.set_result(context.data_aggregator.to_frame())
+        return True
+
+    def _append_contract_details(self, context: RequestContext, message: dict) -> bool:
+        if context.data_aggregator is None:
+            context.data_aggregator = []
+        context.data_aggregator.append(message['data']['contractDetails'])
+        return False  # Don't resolve future yet, wait for CONTRACT_DETAILS_END
+
+    def _finish_contract_details(self, context: RequestContext, message: dict) -> bool:
+        if not context.future.done():
+            context.future.set_result(context.data_aggregator or [])
+        return True
+
+    def _resolve_news_providers(self, context: RequestContext, message: dict) -> bool:
+        if not context.future.done():
+            context.future.set_result(message)
+            logger.info("Successfully receives all news providers")
+        return True
+
+    def _reject(self, context: RequestContext, message: dict) -> bool:
+        if not context.future.done():
             context.future.set_exception(RuntimeError(message['data']['message']))
-
-        else: # Default handler for simple request/response
-            if not context.future.done():
-                context.future.set_result(message)
-        
-        # Clean up the pending request
-        self._pending_requests.pop(reqId, None)
-
-    async def _handle_streaming_message(self, message: dict):
+        return True
+
+    def _resolve_default(self, context: RequestContext, message: dict) -> bool:
+        # Default handler for simple request/response
+        if not context.future.done():
+            context.future.set_result(message)
+        return True
+
+    def _handle_streaming_message(self, message: dict):
+        # Ticks arrive in bursts and the dispatcher must never wait on the news
+        # consumers, so a full raw news queue sheds its oldest headline instead.
+        # Drops are counted and logged periodically rather than once per headline.
         if message['type'] == 'NEWS_TICK':
-            if self.raw_news_queue:
-                await self.raw_news_queue.put(message['data'])
+            queue = self.raw_news_queue
+            if queue is not None:
+                if self._dropped_headlines and queue.empty():
+                    logger.warning("Raw news queue drained after dropping %s headlines.", self._dropped_headlines)
+                    self._dropped_headlines = 0
+                try:
+                    queue.put_nowait(message['data'])
+                except asyncio.QueueFull:
+                    queue.get_nowait()
+                    queue.task_done()
+                    queue.put_nowait(message['data'])
+                    self._dropped_headlines += 1
+                    dropped = self._dropped_headlines
+                    if dropped == 1 or dropped % self.DROPPED_HEADLINES_LOG_INTERVAL == 0:
+                        logger.warning("Raw news queue full, %s headlines dropped so far.", dropped)
 
     def _handle_system_message(self, message: dict):
         if message['type'] == 'NEXT_VALID_ID':
@@ -285,40 +541,28 @@ class IBKRBridge:
 
             # Differentiate between logging level based on code
             if 2100 <= code <= 2200 or code == 2158:
-                logging.info(f"IBKR Info: Code {code}, Message: '{message_text}'")
+                logger.info("IBKR Info: Code %s, Message: '%s'", code, message_text)
             else:
-                logging.error(f"IBKR Error: reqId {reqId}, Code {code}, Message: '{message_text}'")
-
-    async def _send_request(self, request_type: str, use_req_id: bool = True, **kwargs) -> asyncio.Future:
-        req_id = self._get_next_req_id() if use_req_id else -1
-        future = asyncio.get_running_loop().create_future()
-        
-        # The key for reqId-less requests will be its temporary reqId (-1, -2, etc.)
-        self._pending_requests[req_id] = RequestContext(reqId=req_id, future=future, request_type=request_type)
-        
-        # For methods that fit the pattern, we can call the client here
-        if hasattr(self.client, request_type.lower()):
-            method_to_call = getattr(self.client, request_type.lower())
-            method_to_call(req_id, **kwargs)
-        
-        return future
+                logger.error("IBKR Error: reqId %s, Code %s, Message: '%s'", reqId, code, message_text)
 
     # --- ID Generation Methods --- (These are unchanged and correct)
     def _get_next_req_id(self) -> int:
-        with self._req_id_lock:
-            self._next_req_id += 1
-            return self._next_req_id
+        return self._req_id_counter()
 
     def _get_next_order_id(self) -> int:
+        return self._reserve_order_ids(1)
+
+    def _reserve_order_ids(self, count: int) -> int:
+        """Reserves `count` consecutive order ids and returns the first one."""
         with self._order_id_lock:
             if self._next_order_id == -1:
                 raise ConnectionError("Cannot get next order ID: nextValidId has not been received from IBKR yet.")
-            current_id = self._next_order_id
-            self._next_order_id += 1
-            return current_id
+            first_id = self._next_order_id
+            self._next_order_id += count
+            return first_id
     
     def _set_initial_order_id(self, order_id: int):
         with self._order_id_lock:
             if self._next_order_id == -1:
                 self._next_order_id = order_id
-                logging.info(f"Initial order ID set to: {order_id}")
\ No newline at end of file
+                logger.info("Initial order ID set to: %s", order_id)
\ No newline at end of file
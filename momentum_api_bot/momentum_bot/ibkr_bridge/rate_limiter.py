@@ -0,0 +1,46 @@
+"""
+Contains the SlidingWindowLimiter class, used by the IBKRBridge to pace
+outbound requests so they stay within the limits enforced by TWS/Gateway.
+
+IBKR allows at most 50 messages per second from a client and applies a much
+tighter budget to historical data requests (60 per 10 minutes).
+Exceeding either leads to pacing violations and, eventually, a forced
+disconnect, so it is cheaper to wait briefly on our side than to recover.
+"""
+
+import asyncio
+import time
+from collections import deque
+
+class SlidingWindowLimiter:
+    """
+    An asyncio rate limiter that allows at most `max_calls` acquisitions in any
+    `period`-second window. It remembers the time of each recent acquisition,
+    so unlike a token bucket an initial burst can never be followed by a full
+    window of refills.
+    """
+
+    def __init__(self, max_calls: int, period: float):
+        """
+        Args:
+            max_calls: Maximum number of acquisitions within one window.
+            period: Length of the window in seconds.
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self._sent = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Waits until sending one more message keeps the window within its limit."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= self.period:
+                    self._sent.popleft()
+
+                if len(self._sent) < self.max_calls:
+                    self._sent.append(now)
+                    return
+
+                await asyncio.sleep(self.period - (now - self._sent[0]))
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from momentum_api_bot.momentum_bot.ibkr_bridge.bar_buffer import BarBuffer, _parse_bar_date, expected_bar_count
+
+def make_bar(date: str, value: float) -> dict:
+    return {'date': date, 'open': value, 'high': value, 'low': value, 'close': value, 'volume': value}
+
+class TestExpectedBarCount(unittest.TestCase):
+    """Unit tests for sizing the bar buffer from IBKR duration/bar-size strings."""
+
+    def test_intraday_session(self):
+        self.assertEqual(expected_bar_count('1 D', '1 min'), 391)
+
+    def test_plural_units_and_seconds_duration(self):
+        self.assertEqual(expected_bar_count('3600 S', '5 secs'), 721)
+        self.assertEqual(expected_bar_count('1800 S', '30 mins'), 2)
+        self.assertEqual(expected_bar_count('2 W', '1 hour'), 66)
+
+    def test_daily_bars_over_a_year(self):
+        self.assertEqual(expected_bar_count('1 Y', '1 day'), 253)
+
+    def test_unparseable_strings_fall_back_to_default(self):
+        self.assertEqual(expected_bar_count('30 T', '1 min'), 1024)
+        self.assertEqual(expected_bar_count('1 D', 'garbage'), 1024)
+        self.assertEqual(expected_bar_count('', '1 min', default=16), 16)
+
+    def test_estimate_is_capped(self):
+        self.assertEqual(expected_bar_count('100 Y', '1 secs'), 1 << 20)
+
+class TestParseBarDate(unittest.TestCase):
+    """Unit tests for the two date formats returned with formatDate=2."""
+
+    def test_epoch_seconds(self):
+        slot = np.empty(1, dtype='datetime64[s]')
+        slot[0] = _parse_bar_date('1705329000')
+        self.assertEqual(slot[0], np.datetime64('2024-01-15T14:30:00'))
+
+    def test_daily_date(self):
+        self.assertEqual(_parse_bar_date('20240115'), np.datetime64('2024-01-15T00:00:00'))
+
+class TestBarBuffer(unittest.TestCase):
+    """Unit tests for the columnar bar store."""
+
+    def test_grows_past_initial_capacity(self):
+        buffer = BarBuffer(capacity=2)
+        for i in range(5):
+            buffer.append(make_bar(str(1705329000 + 60 * i), float(i)))
+
+        self.assertEqual(len(buffer), 5)
+        frame = buffer.to_frame()
+        self.assertEqual(list(frame.columns), list(BarBuffer.COLUMNS))
+        self.assertEqual(frame['close'].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(frame.index[-1], np.datetime64('2024-01-15T14:34:00'))
+
+    def test_empty_buffer_gives_empty_frame(self):
+        frame = BarBuffer().to_frame()
+        self.assertTrue(frame.empty)
+        self.assertEqual(frame.index.name, 'date')
+
+if __name__ == '__main__':
+    unittest.main()
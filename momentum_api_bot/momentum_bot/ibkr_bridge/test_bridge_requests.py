@@ -0,0 +1,179 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from ibapi.contract import Contract, ContractDetails
+
+from momentum_api_bot.momentum_bot.ibkr_bridge.bridge import IBKRBridge
+
+class FakeClient:
+    """Stands in for EClient, recording requests instead of sending them."""
+
+    def __init__(self):
+        self.calls = []
+
+    def reqHistoricalData(self, reqId, contract, *args):
+        self.calls.append(('reqHistoricalData', reqId, contract))
+
+    def reqContractDetails(self, reqId, contract):
+        self.calls.append(('reqContractDetails', reqId, contract))
+
+    def disconnect(self):
+        pass
+
+class GateLimiter:
+    """A limiter whose acquire() blocks until the test opens the gate."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+
+    async def acquire(self):
+        await self.gate.wait()
+
+def make_contract(symbol: str = 'AAPL', expiry: str = '') -> Contract:
+    contract = Contract()
+    contract.symbol = symbol
+    contract.secType = 'FUT' if expiry else 'STK'
+    contract.lastTradeDateOrContractMonth = expiry
+    contract.exchange = 'SMART'
+    contract.currency = 'USD'
+    return contract
+
+def make_bar(epoch: int, close: float) -> SimpleNamespace:
+    return SimpleNamespace(date=str(epoch), open=close, high=close, low=close, close=close,
+                           volume=100.0, barCount=1, average=close)
+
+class TestBridgeRequestSharing(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for request sharing in IBKRBridge. The EClient is replaced by a fake,
+    and responses are fed through the wrapper callbacks, so no TWS is needed.
+    """
+
+    async def asyncSetUp(self):
+        self.bridge = IBKRBridge('127.0.0.1', 7497, 1)
+        self.client = FakeClient()
+        self.bridge.client = self.client
+        self.bridge._loop = asyncio.get_running_loop()
+        self.bridge.wrapper.loop = self.bridge._loop
+        self.bridge.state = "OPERATIONAL"
+        self.bridge.dispatcher_task = asyncio.create_task(self.bridge._dispatch_incoming_messages())
+
+    async def asyncTearDown(self):
+        await self.bridge.disconnect()
+
+    async def settle(self):
+        """Lets pending tasks and queued wrapper callbacks run."""
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+    def send_bars(self, req_id: int, closes: list):
+        for i, close in enumerate(closes):
+            self.bridge.wrapper.historicalData(req_id, make_bar(1705329000 + 60 * i, close))
+        self.bridge.wrapper.historicalDataEnd(req_id, '', '')
+
+    def send_details(self, req_id: int, contract: Contract) -> ContractDetails:
+        details = ContractDetails()
+        details.contract = contract
+        self.bridge.wrapper.contractDetails(req_id, details)
+        self.bridge.wrapper.contractDetailsEnd(req_id)
+        return details
+
+    async def test_concurrent_historical_requests_share_one_call(self):
+        contract = make_contract()
+        tasks = [asyncio.create_task(self.bridge.fetch_historical_data(contract, '1 D', '1 min')) for _ in range(3)]
+        await self.settle()
+
+        self.assertEqual(len(self.client.calls), 1)
+        self.send_bars(self.client.calls[0][1], [1.0, 2.0])
+        frames = await asyncio.gather(*tasks)
+
+        for frame in frames:
+            self.assertEqual(frame['close'].tolist(), [1.0, 2.0])
+        # Each caller gets its own copy of the frame.
+        self.assertIsNot(frames[0], frames[1])
+        self.assertEqual(self.bridge._pending_requests, {})
+        self.assertEqual(self.bridge._inflight_historical_data, {})
+
+    async def test_contracts_differing_by_expiry_are_not_shared(self):
+        tasks = [
+            asyncio.create_task(self.bridge.fetch_historical_data(make_contract('ES', expiry), '1 D', '1 min'))
+            for expiry in ('202412', '202503')
+        ]
+        await self.settle()
+
+        self.assertEqual(len(self.client.calls), 2)
+        for _, req_id, _ in self.client.calls:
+            self.send_bars(req_id, [1.0])
+        await asyncio.gather(*tasks)
+
+    async def test_sharer_takes_over_when_owner_is_cancelled_before_sending(self):
+        limiter = GateLimiter()
+        self.bridge._hist_limiter = limiter
+        contract = make_contract()
+        owner = asyncio.create_task(self.bridge.fetch_historical_data(contract, '1 D', '1 min'))
+        await self.settle()
+        sharer = asyncio.create_task(self.bridge.fetch_historical_data(contract, '1 D', '1 min'))
+        await self.settle()
+
+        owner.cancel()
+        await self.settle()
+        self.assertTrue(owner.cancelled())
+        self.assertFalse(sharer.done())
+        self.assertEqual(self.client.calls, [])
+
+        limiter.gate.set()
+        await self.settle()
+        self.assertEqual(len(self.client.calls), 1)
+        self.send_bars(self.client.calls[0][1], [3.0])
+        frame = await sharer
+        self.assertEqual(frame['close'].tolist(), [3.0])
+
+    async def test_error_rejects_every_waiter(self):
+        contract = make_contract()
+        tasks = [asyncio.create_task(self.bridge.fetch_historical_data(contract, '1 D', '1 min')) for _ in range(3)]
+        await self.settle()
+
+        self.bridge.wrapper.error(self.client.calls[0][1], 162, 'Historical Market Data Service error message')
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+        self.assertEqual(self.bridge._pending_requests, {})
+        self.assertEqual(self.bridge._inflight_historical_data, {})
+
+    async def test_contract_details_are_shared_and_cached(self):
+        contract = make_contract()
+        tasks = [asyncio.create_task(self.bridge.request_contract_details(contract)) for _ in range(3)]
+        await self.settle()
+
+        self.assertEqual(len(self.client.calls), 1)
+        details = self.send_details(self.client.calls[0][1], contract)
+        results = await asyncio.gather(*tasks)
+        for result in results:
+            self.assertEqual(result, [details])
+
+        # A later lookup of an equal contract is answered from the cache.
+        self.assertEqual(await self.bridge.request_contract_details(make_contract()), [details])
+        self.assertEqual(len(self.client.calls), 1)
+
+    async def test_contract_details_sharer_takes_over_when_owner_is_cancelled(self):
+        limiter = GateLimiter()
+        self.bridge._msg_limiter = limiter
+        contract = make_contract()
+        owner = asyncio.create_task(self.bridge.request_contract_details(contract))
+        await self.settle()
+        sharer = asyncio.create_task(self.bridge.request_contract_details(contract))
+        await self.settle()
+
+        owner.cancel()
+        limiter.gate.set()
+        await self.settle()
+        self.assertTrue(owner.cancelled())
+        self.assertEqual(len(self.client.calls), 1)
+
+        details = self.send_details(self.client.calls[0][1], contract)
+        self.assertEqual(await sharer, [details])
+        self.assertEqual(self.bridge._pending_requests, {})
+
+if __name__ == '__main__':
+    unittest.main()
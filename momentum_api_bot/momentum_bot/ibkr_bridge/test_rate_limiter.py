@@ -0,0 +1,29 @@
+import time
+import unittest
+
+from momentum_api_bot.momentum_bot.ibkr_bridge.rate_limiter import SlidingWindowLimiter
+
+class TestSlidingWindowLimiter(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the outbound pacing limiter. No TWS needed."""
+
+    async def test_burst_is_capped_at_max_calls(self):
+        limiter = SlidingWindowLimiter(max_calls=5, period=0.2)
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        self.assertLess(time.monotonic() - start, 0.1, "A burst up to the limit should not wait")
+
+    async def test_no_window_exceeds_max_calls(self):
+        max_calls, period = 5, 0.2
+        limiter = SlidingWindowLimiter(max_calls=max_calls, period=period)
+        sent = []
+        for _ in range(3 * max_calls + 1):
+            await limiter.acquire()
+            sent.append(time.monotonic())
+
+        # Any max_calls + 1 consecutive sends must span at least one full window.
+        for first, last in zip(sent, sent[max_calls:]):
+            self.assertGreaterEqual(last - first, period)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,8 +3,8 @@ Contains the IBWrapper class, which subclasses ibapi.wrapper.EWrapper.
 
 This class is the single point of entry for all incoming data from the TWS/Gateway.
 Its only responsibility is to receive the data from the IBKR API thread,
-package it into a standardized dictionary format, and put it onto a thread-safe
-queue.
+package it into a standardized dictionary format, and hand it to the asyncio
+event loop's incoming queue.
 
 All business logic is handled by the asynchronous part of the application,
 ensuring this class remains a simple, non-blocking data receiver.
@@ -16,33 +16,57 @@ from ibapi.order import Order
 from ibapi.order_state import OrderState
 from ibapi.ticktype import TickTypeEnum
 from ibapi.commission_report import CommissionReport
-import queue
+import asyncio
 import logging
+from typing import Optional
+
+# Module-level copy of the tick type id -> name dict. Saves the TickTypeEnum
+# attribute lookup per tick; names for unknown ids fall back to the raw id.
+_TICK_TYPE_NAMES = dict(TickTypeEnum.idx2name)
+
+# These are not errors, but informational messages (farm connection status
+# and the like). They are logged and not treated as errors.
+_INFO_CODES = frozenset({
+    2104, 2106, 2158, 2100, 2103, 2105, 2107, 2108, 2119, 2150,
+    2168, 2169, 2170, 2157
+})
 
 class IBWrapper(EWrapper):
     """
     Subclass of EWrapper, designed to redirect all incoming events into a
-    single, thread-safe queue for consumption by the main asyncio application.
+    single asyncio queue for consumption by the main asyncio application.
     """
 
     # Fixed request ids for infrequently api calls
     REQ_ID_NEWS_PROVIDERS = -101
 
-    def __init__(self, incoming_messages_queue: queue.Queue):
+    def __init__(self, incoming_messages_queue: asyncio.Queue):
         """
         Initializes the EWrapper.
 
         Args:
-            incoming_messages_queue: A thread-safe queue.Queue instance.
+            incoming_messages_queue: An asyncio.Queue owned by the event loop.
                                      All callback methods will put their
                                      data into this queue.
         """
         super().__init__()
         self.incoming_queue = incoming_messages_queue
+        # Set by the bridge on connect; callbacks run on the API thread, so
+        # every put has to be scheduled onto this loop.
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _enqueue_message(self, msg_type: str, data: dict):
         """A standardized helper to put messages on the queue."""
-        self.incoming_queue.put({'type': msg_type, 'data': data})
+        if self.loop is None:
+            # EClient reports some failures (e.g. 504 "Not connected")
+            # synchronously, before connect() has handed us a loop.
+            logging.debug("Dropping %s message: not connected to an event loop.", msg_type)
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.incoming_queue.put_nowait, {'type': msg_type, 'data': data})
+        except RuntimeError:
+            # The event loop has already been closed during shutdown.
+            logging.debug("Dropping %s message: event loop is closed.", msg_type)
 
     # --- Core System & Connection Callbacks ---
 
@@ -55,15 +79,8 @@ class IBWrapper(EWrapper):
         """
         # Overriding the EWrapper method. The `advancedOrderRejectJson` parameter was added in later API versions.
 
-        # These are not errors, but informational messages.
-        # We will log them and not treat them as errors.
-        INFO_CODES = {
-            2104, 2106, 2158, 2100, 2103, 2105, 2107, 2108, 2119, 2150,
-            2168, 2169, 2170, 2157
-        }
-
-        if errorCode in INFO_CODES:
-            logging.info(f"IBKR Info (Code: {errorCode}): {errorString}")
+        if errorCode in _INFO_CODES:
+            logging.info("IBKR Info (Code: %s): %s", errorCode, errorString)
             return
 
         # For all other codes, treat it as an error.
@@ -76,7 +93,7 @@ class IBWrapper(EWrapper):
 
     def nextValidId(self, orderId: int):
         """EWrapper method that provides the next valid ID for placing an order."""
-        logging.info("This is a test if the nextValidId() call successfully")
+        logging.debug("Received nextValidId: %s", orderId)
         self._enqueue_message('NEXT_VALID_ID', {'orderId': orderId})
 
     def connectAck(self):
@@ -108,11 +125,12 @@ class IBWrapper(EWrapper):
 
     def newsArticle(self, tickerId: int, articleType: int, articleText: str):
         # Callback for receiving the full news article body
-        print(f"News Article: TickerId={tickerId}, Type={articleType}, Text='{articleText[:200]}...'") # Print first 200 chars
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("News Article: TickerId=%s, Type=%s, Text='%s...'", tickerId, articleType, articleText[:200])
 
     def tickNews(self, tickerId: int, timeStamp: int, providerCode: str, articleId: str, headline: str, extraData: str):
         """EWrapper method for when news headlines are received."""
-        logging.info(f"tickNews: {headline}")
+        logging.debug("tickNews: %s", headline)
         self._enqueue_message('NEWS_TICK', {
             'reqId': tickerId,
             'providerCode': providerCode,
@@ -121,6 +139,19 @@ class IBWrapper(EWrapper):
             'extraData': extraData
         })
 
+    # --- Contract Callback Methods ---
+
+    def contractDetails(self, reqId: int, contractDetails: ContractDetails):
+        """EWrapper method that returns one contract matching a reqContractDetails request."""
+        self._enqueue_message('CONTRACT_DETAILS', {
+            'reqId': reqId,
+            'contractDetails': contractDetails
+        })
+
+    def contractDetailsEnd(self, reqId: int):
+        """EWrapper method called after all contract details for a request have been sent."""
+        self._enqueue_message('CONTRACT_DETAILS_END', {'reqId': reqId})
+
     # --- Order and Position Callback Methods ---
 
     def openOrder(self, orderId: int, contract: Contract, order: Order, orderState: OrderState):
@@ -180,7 +211,7 @@ class IBWrapper(EWrapper):
         """EWrapper method called with real-time price updates for a subscription."""
         self._enqueue_message('TICK_PRICE', {
             'reqId': reqId,
-            'tickType': TickTypeEnum.idx2name.get(tickType, tickType),
+            'tickType': _TICK_TYPE_NAMES.get(tickType, tickType),
             'price': price
         })
     
@@ -188,7 +219,7 @@ class IBWrapper(EWrapper):
         """EWrapper method called with real-time size updates (e.g., volume)."""
         self._enqueue_message('TICK_SIZE', {
             'reqId': reqId,
-            'tickType': TickTypeEnum.idx2name.get(tickType, tickType),
+            'tickType': _TICK_TYPE_NAMES.get(tickType, tickType),
             'size': size
         })
 
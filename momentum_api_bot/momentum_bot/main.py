@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import queue
+import signal
 import yaml
 import sys
 import os
@@ -14,9 +16,23 @@ from momentum_bot.services.execution_service import ExecutionService
 from momentum_bot.services.position_manager import PositionManager
 from momentum_bot.database import init_db
 from ibapi.contract import Contract
+from logging.handlers import QueueHandler, QueueListener
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def start_log_listener() -> QueueListener:
+    """
+    Routes all log records through a queue drained by a background thread.
+    QueueHandler still formats each record on the calling thread, but the
+    handlers' stream I/O moves off callers such as the IBKR API thread.
+    """
+    root_logger = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
 async def main():
     logging.info("Starting Momentum API Bot...")
 
@@ -27,6 +43,10 @@ async def main():
             "port": 7496,
             "client_id": 1
         },
+        "news_handler": {
+            "num_workers": 4,
+            "raw_queue_size": 5000
+        },
         "detection_engine": {
             "num_workers": 5
         },
@@ -56,7 +76,7 @@ async def main():
     logging.info(f"Database initialized at {config["database"]["url"]}")
 
     # --- Queues for Inter-Service Communication ---
-    raw_news_queue = asyncio.Queue()        # Bridge -> NewsHandler
+    raw_news_queue = asyncio.Queue(maxsize=config.get("news_handler", {}).get("raw_queue_size", 5000))  # Bridge -> NewsHandler
     processed_news_queue = asyncio.Queue()  # NewsHandler -> DetectionEngine
     trade_signal_queue = asyncio.Queue()    # DetectionEngine -> ExecutionService
 
@@ -70,7 +90,8 @@ async def main():
 
     news_handler = NewsHandler(
         raw_news_queue=raw_news_queue,
-        processed_news_queue=processed_news_queue
+        processed_news_queue=processed_news_queue,
+        num_workers=config.get("news_handler", {}).get("num_workers", 4)
     )
 
     detection_engine = DetectionEngine(ibkr_bridge, processed_news_queue, trade_signal_queue, num_workers=config["detection_engine"]["num_workers"])
@@ -100,9 +121,19 @@ async def main():
 
     logging.info("Momentum API Bot services started. Press Ctrl+C to stop.")
 
+    # SIGINT/SIGTERM set this event so shutdown runs through the finally block
+    # below instead of interrupting whatever the loop happens to be doing.
+    shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown_event.set)
+        except NotImplementedError:
+            pass  # Not supported on Windows; Ctrl+C still cancels main()
+
     try:
-        # Keep the main task alive by waiting indefinitely
-        await asyncio.Event().wait()
+        await shutdown_event.wait()
+        logging.info("Shutdown signal received.")
     except (KeyboardInterrupt, asyncio.CancelledError):
         logging.info("Application shutdown initiated.")
     finally:
@@ -115,7 +146,9 @@ async def main():
             await execution_service.stop()
         if 'detection_engine' in locals():
             await detection_engine.stop()
-        
+        if 'news_handler' in locals():
+            await news_handler.stop()
+
         # Disconnect the bridge last
         if 'ibkr_bridge' in locals() and ibkr_bridge.state != "DISCONNECTED":
             await ibkr_bridge.disconnect()
@@ -123,9 +156,16 @@ async def main():
         logging.info("Momentum API Bot shutdown complete.")
 
 if __name__ == "__main__":
+    # Started outside main() so the listener also covers failures before the
+    # services are up (e.g. a connect timeout) and the error logged below.
+    log_listener = start_log_listener()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         logging.info("Application exit due to KeyboardInterrupt.")
     except Exception as e:
         logging.error(f"An unhandled error occurred in main: {e}", exc_info=True)
+    finally:
+        # Flushes queued records, then hands the original handlers back.
+        log_listener.stop()
+        logging.getLogger().handlers = list(log_listener.handlers)
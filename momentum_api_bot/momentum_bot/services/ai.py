@@ -5,6 +5,12 @@ import logging
 import os
 from typing import Optional
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    _json_loads = json.loads
+
 # In a real application, these should come from a secure config or environment loader
 DEFAULT_AI_API_URL = os.environ.get("AI_API_URL", "https://api.openai.com/v1/chat/completions")
 DEFAULT_AI_MODEL = os.environ.get("AI_MODEL", "gpt-3.5-turbo")
@@ -64,11 +70,11 @@ async def extract_symbols_with_ai(
         timeout = aiohttp.ClientTimeout(total=15)
         async with session.post(api_url, headers=headers, json=payload, timeout=timeout) as response:
             response.raise_for_status()
-            response_json = await response.json()
+            response_json = await response.json(loads=_json_loads)
             
             content = response_json.get("choices", [{}])[0].get("message", {}).get("content", "[]")
             
-            symbols = json.loads(content)
+            symbols = _json_loads(content)
             
             if isinstance(symbols, list):
                 # Basic validation for ticker-like strings
@@ -2,9 +2,8 @@ import asyncio
 import logging
 import pandas as pd
 import numpy as np
-from ibapi.contract import Contract
 from momentum_bot.models import TradeSignal
-from momentum_bot.utils import calculate_atr, calculate_sma
+from momentum_bot.utils import calculate_atr, calculate_sma, make_stock_contract
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -39,11 +38,7 @@ class DetectionEngine:
 
                 # Fetch historical data for ATR/SMA calculation
                 logging.info(f"DetectionEngine {worker_id}: Fetching historical data for {ticker}.")
-                contract = Contract()
-                contract.symbol = ticker
-                contract.secType = 'STK'
-                contract.exchange = 'SMART'
-                contract.currency = 'USD'
+                contract = make_stock_contract(ticker)
 
                 # Request historical data
                 hist_data_req_id = self.ibkr_bridge.request_historical_data(
@@ -4,7 +4,7 @@ import asyncio
 import logging
 from momentum_bot.models import TradeSignal, Position
 from momentum_bot.database import PositionRecord, Trade
-from ibapi.contract import Contract
+from momentum_bot.utils import make_stock_contract
 from ibapi.order import Order
 from sqlalchemy.orm import sessionmaker
 import datetime
@@ -40,11 +40,7 @@ class ExecutionService:
                 # For simplicity, let's assume a fixed quantity for now
                 quantity = 10 # Example fixed quantity
 
-                contract = Contract()
-                contract.symbol = trade_signal.symbol
-                contract.secType = 'STK'
-                contract.exchange = 'SMART'
-                contract.currency = 'USD'
+                contract = make_stock_contract(trade_signal.symbol)
 
                 order = Order()
                 order.action = trade_signal.action
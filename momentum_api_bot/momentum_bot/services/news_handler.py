@@ -7,29 +7,35 @@ from momentum_bot.services.ai import extract_symbols_with_ai
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class NewsHandler:
-    def __init__(self, raw_news_queue: asyncio.Queue, processed_news_queue: asyncio.Queue):
+    def __init__(self, raw_news_queue: asyncio.Queue, processed_news_queue: asyncio.Queue, num_workers: int = 4):
         self.raw_news_queue = raw_news_queue
         self.processed_news_queue = processed_news_queue
+        self.num_workers = num_workers
         self.http_session: aiohttp.ClientSession | None = None
-        self._processing_task: asyncio.Task | None = None
-        logging.info("NewsHandler initialized.")
+        self._processing_tasks: list[asyncio.Task] = []
+        logging.info(f"NewsHandler initialized with {num_workers} workers.")
 
     async def start(self):
         """Starts the news handler, creates an HTTP session, and begins processing articles."""
         logging.info("NewsHandler started. Creating HTTP session...")
-        self.http_session = aiohttp.ClientSession()
-        self._processing_task = asyncio.create_task(self._process_news_articles())
+        # ClientSession pools keep-alive connections by default; this only caps the
+        # pool at 20 connections (10 per host), caches DNS for 5 minutes and keeps
+        # idle connections for 30s so gaps between news bursts don't drop them.
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=30)
+        self.http_session = aiohttp.ClientSession(connector=connector)
+        # Several workers share the queue so AI round-trips for different
+        # articles overlap instead of being awaited one after another.
+        for _ in range(self.num_workers):
+            self._processing_tasks.append(asyncio.create_task(self._process_news_articles()))
         logging.info("NewsHandler is now processing news articles.")
 
     async def stop(self):
         """Stops the news handler and gracefully closes the HTTP session."""
         logging.info("Stopping NewsHandler...")
-        if self._processing_task:
-            self._processing_task.cancel()
-            try:
-                await self._processing_task
-            except asyncio.CancelledError:
-                pass # Expected
+        for task in self._processing_tasks:
+            task.cancel()
+        await asyncio.gather(*self._processing_tasks, return_exceptions=True)
+        self._processing_tasks.clear()
         if self.http_session:
             await self.http_session.close()
             logging.info("HTTP session closed.")
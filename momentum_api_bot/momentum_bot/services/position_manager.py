@@ -3,7 +3,7 @@ import logging
 from momentum_bot.models import Position, TradeSignal
 from momentum_bot.services.execution_service import ExecutionService
 from momentum_bot.database import PositionRecord, Trade
-from ibapi.contract import Contract
+from momentum_bot.utils import make_stock_contract
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import select
 import datetime
@@ -45,11 +45,7 @@ class PositionManager:
                     logging.info(f"PositionManager: Checking position for {symbol}: {position_record}")
                     
                     # Fetch real-time market data for the open position
-                    contract = Contract()
-                    contract.symbol = symbol
-                    contract.secType = 'STK'
-                    contract.exchange = 'SMART'
-                    contract.currency = 'USD'
+                    contract = make_stock_contract(symbol)
 
                     market_data_req_id = self.ibkr_bridge.request_market_data(contract, snapshot=True) # Request a snapshot
                     logging.info(f"PositionManager: Requested market data snapshot for {symbol} with ReqId: {market_data_req_id}")
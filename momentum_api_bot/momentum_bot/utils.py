@@ -2,6 +2,7 @@ import xml.etree.ElementTree as ET
 import logging
 import pandas as pd
 import numpy as np
+from ibapi.contract import Contract
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -47,11 +48,14 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     if not all(col in df.columns for col in ['high', 'low', 'close']):
         raise ValueError("DataFrame must contain 'high', 'low', and 'close' columns for ATR calculation.")
 
+    prev_close = df['close'].shift()
     high_low = df['high'] - df['low']
-    high_prev_close = np.abs(df['high'] - df['close'].shift())
-    low_prev_close = np.abs(df['low'] - df['close'].shift())
+    high_prev_close = np.abs(df['high'] - prev_close)
+    low_prev_close = np.abs(df['low'] - prev_close)
 
-    true_range = pd.DataFrame({'hl': high_low, 'hpc': high_prev_close, 'lpc': low_prev_close}).max(axis=1)
+    # Element-wise max over the three ranges without materialising a temporary
+    # DataFrame; fmax ignores the NaN produced by the first shifted close.
+    true_range = np.fmax(high_low, np.fmax(high_prev_close, low_prev_close))
     atr = true_range.ewm(span=period, adjust=False).mean()
     return atr
 
@@ -59,4 +63,16 @@ def calculate_sma(series: pd.Series, period: int) -> pd.Series:
     """
     Calculates the Simple Moving Average (SMA).
     """
-    return series.rolling(window=period).mean()
\ No newline at end of file
+    return series.rolling(window=period).mean()
+
+def make_stock_contract(symbol: str, exchange: str = 'SMART', currency: str = 'USD') -> Contract:
+    """
+    Returns a new SMART-routed stock Contract for the symbol.
+    Callers own the instance and may fill in conId, primaryExchange, etc.
+    """
+    contract = Contract()
+    contract.symbol = symbol
+    contract.secType = 'STK'
+    contract.exchange = exchange
+    contract.currency = currency
+    return contract